@@ -0,0 +1,122 @@
+import os
+
+import minesweeper
+from minesweeper import Minesweeper
+from ai_player import MinesweeperAI
+
+# The start_game presets, re-keyed by lowercase name for this module's API
+DIFFICULTIES = {
+    label.lower(): (rows, cols, mines)
+    for label, rows, cols, mines in minesweeper.DIFFICULTIES.values()
+}
+
+def _play_one(difficulty, seed):
+    """
+    Play a single AI game at the given difficulty.
+
+    Args:
+        difficulty (str): One of the DIFFICULTIES keys.
+        seed (int): Seed for the board RNG, so runs are reproducible.
+
+    Returns:
+        tuple: A (won, moves) pair for the finished game.
+    """
+    rows, cols, mines = DIFFICULTIES[difficulty]
+    # The board carries its own seeded RNG, so worker games stay
+    # reproducible even though each process has fresh global random state
+    game = Minesweeper(rows, cols, mines, seed=seed)
+    ai = MinesweeperAI(game)
+    target = rows * cols - mines  # Number of safe cells to uncover for a win
+    moves = 0
+    while moves <= rows * cols:
+        moves += 1
+        if not ai.make_move():
+            return False, moves  # Hit a mine
+        if ai.uncovered_bits.bit_count() >= target:
+            return True, moves  # Every safe cell uncovered
+    return False, moves  # No progress possible (bad flags); count as a loss
+
+def ai_demo_auto(difficulty='beginner', total_games=5, seed=0, workers=None):
+    """
+    Play several AI games at one difficulty and print a summary.
+
+    Games are independent, so they are distributed across CPU cores with a
+    process pool for a near-linear speedup over the serial loop.
+
+    Args:
+        difficulty (str): One of the DIFFICULTIES keys.
+        total_games (int): Number of games to play.
+        seed (int): Base seed; game i uses seed + i.
+        workers (int): Pool size; defaults to one per core, capped at
+            total_games so small runs do not fork idle processes.
+
+    Returns:
+        tuple: A (wins, total_moves) pair aggregated over all games.
+    """
+    import multiprocessing  # Deferred so interactive use never pays for it
+
+    args = [(difficulty, seed + i) for i in range(total_games)]
+    if workers is None:
+        workers = min(total_games, os.cpu_count() or 1)
+    # The move loop is pure Python and holds the GIL, so processes (not
+    # threads) do the scaling here; batching several short games per task
+    # amortizes the per-task IPC that dominates quick beginner games
+    chunksize = max(1, total_games // workers)
+    with multiprocessing.Pool(workers) as pool:
+        outcomes = pool.starmap(_play_one, args, chunksize)
+    wins = sum(1 for won, _ in outcomes if won)
+    total_moves = sum(moves for _, moves in outcomes)
+    print(f"{difficulty}: {wins}/{total_games} games won, {total_moves} total moves")
+    return wins, total_moves
+
+def ai_demo_interactive(difficulty='beginner', auto_delay=None, seed=None):
+    """
+    Step through a single AI game, showing the board after every move.
+
+    Args:
+        difficulty (str): One of the DIFFICULTIES keys.
+        auto_delay (float): If None, wait for Enter between moves; otherwise
+            sleep this many seconds instead, so the demo can run unattended
+            and double as a move-latency benchmark. Zero (or negative)
+            skips the sleep call entirely for clean timing runs.
+        seed (int): Optional seed for the board RNG.
+
+    Returns:
+        bool: True if the AI won the game, False otherwise.
+    """
+    import heapq  # Only the interactive path pays these import costs
+    import operator
+    import time
+
+    rows, cols, mines = DIFFICULTIES[difficulty]
+    game = Minesweeper(rows, cols, mines, seed=seed)
+    ai = MinesweeperAI(game, verbose=True)  # Benchmark mode leaves this off
+    target = rows * cols - mines
+    move = 0
+    while True:
+        move += 1
+        alive = ai.make_move()
+        print(f"\nMove {move}: {ai.explain_last_move()}")
+        game.print_board()
+        # Show the five cells the AI currently considers safest;
+        # nsmallest is O(F log 5) versus O(F log F) for a full sort
+        probs = ai.calculate_mine_probabilities()
+        for (r, c), prob in heapq.nsmallest(5, probs.items(), key=operator.itemgetter(1)):
+            print(f"  ({r}, {c}): {prob:.1%} mine probability")
+        if not alive:
+            print("Game Over! The AI hit a mine.")
+            return False
+        if ai.uncovered_bits.bit_count() >= target:
+            print("The AI won the game!")
+            return True
+        if auto_delay is None:
+            input("Press Enter for the next move...")
+        elif auto_delay > 0:
+            # No sleep syscall at zero delay, so profiles of the demo
+            # measure the AI's real per-move cost
+            time.sleep(auto_delay)
+
+# Run the automatic demo across the smaller difficulties
+if __name__ == "__main__":
+    for name in ('beginner', 'intermediate'):
+        ai_demo_auto(name)
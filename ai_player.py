@@ -1,14 +1,388 @@
+import array
+import collections
+import operator
+
+UNKNOWN = 255  # Sentinel value for cells the AI has not seen yet
+
+def _csp_propagate(values, neighbors, flag_bits, active_bits):
+    """
+    Run constraint propagation over the active numbered cells to a fixpoint.
+
+    Each revealed numbered cell constrains its neighbors: if the number of
+    flagged/deduced mines around it equals its value, the remaining unknown
+    neighbors are safe; if the mines still needed equal the number of unknown
+    neighbors, those neighbors must all be mines.
+
+    Only the cells in active_bits are scanned, and cells whose neighbors are
+    all resolved are dropped from it, so per-move work tracks the size of
+    the live frontier instead of the whole board.
+
+    Args:
+        values (bytearray): Known cell values by flat index; UNKNOWN until seen.
+        neighbors (list): Per-cell tuples of neighbor flat indices.
+        flag_bits (int): Bitboard of flagged cells (bit r*cols + c).
+        active_bits (int): Bitboard of numbered cells that may still
+            constrain unknown neighbors.
+
+    Returns:
+        tuple: (safe_bits, mine_bits, active_bits) — bitboards of deduced
+            cells plus the active set with exhausted cells removed.
+    """
+    safe_bits = 0
+    mine_bits = 0
+    # Worklist fixpoint: the first pass visits every active cell, later
+    # passes only the cells watching something deduced in the previous
+    # pass, instead of re-sweeping the whole active set each round
+    pending = active_bits
+    while pending:
+        woken = 0
+        m = pending
+        while m:
+            b = m & -m  # Isolate the lowest set bit
+            m ^= b
+            i = b.bit_length() - 1
+            value = values[i]
+            unknown_bits = 0
+            unknown_count = 0
+            mine_count = 0
+            committed_unknown = False
+            for n in neighbors[i]:
+                bit = 1 << n
+                if flag_bits & bit:
+                    mine_count += 1
+                elif values[n] == UNKNOWN:
+                    committed_unknown = True
+                    if mine_bits & bit:
+                        mine_count += 1
+                    elif not safe_bits & bit:
+                        unknown_bits |= bit
+                        unknown_count += 1
+            if not committed_unknown:
+                # Every neighbor is revealed or flagged; this cell can
+                # never constrain anything again, so retire it
+                active_bits &= ~b
+                continue
+            if not unknown_bits:
+                continue
+            if mine_count == value:
+                safe_bits |= unknown_bits  # All mines accounted for, the rest are safe
+            elif mine_count + unknown_count == value:
+                mine_bits |= unknown_bits  # Every unknown neighbor must be a mine
+            else:
+                continue
+            # Wake the cells watching the just-deduced neighbors
+            while unknown_bits:
+                db = unknown_bits & -unknown_bits
+                unknown_bits ^= db
+                for w in neighbors[db.bit_length() - 1]:
+                    woken |= 1 << w
+        pending = woken & active_bits
+    return safe_bits, mine_bits, active_bits
+
+def _build_constraints(values, neighbors, flag_bits, active_bits):
+    """
+    Collect the active constraints from revealed numbered cells.
+
+    Args:
+        values (bytearray): Known cell values by flat index; UNKNOWN until seen.
+        neighbors (list): Per-cell tuples of neighbor flat indices.
+        flag_bits (int): Bitboard of flagged cells.
+        active_bits (int): Bitboard of numbered cells that may still
+            constrain unknown neighbors.
+
+    Returns:
+        list: (cells, mines) pairs where cells is a tuple of unknown neighbor
+            indices (ascending) and mines is how many of them must be mines.
+            Numbered cells constraining the same set contribute one entry.
+    """
+    # Keyed by the cell tuple: neighbor tables are in ascending flat order,
+    # so equal cell sets always produce equal tuples and duplicates (two
+    # numbers watching the same unknowns) collapse before enumeration
+    constraints = {}
+    m = active_bits
+    while m:
+        b = m & -m
+        m ^= b
+        i = b.bit_length() - 1
+        unknown = []
+        mine_count = 0
+        for n in neighbors[i]:
+            if flag_bits >> n & 1:
+                mine_count += 1
+            elif values[n] == UNKNOWN:
+                unknown.append(n)
+        if unknown:
+            constraints[tuple(unknown)] = values[i] - mine_count
+    return list(constraints.items())
+
+def _subset_inference(constraints):
+    """
+    Derive safe and mine cells from pairs of overlapping constraints.
+
+    If one constraint's cells are a subset of another's, the cells only in
+    the larger one must hold exactly the difference of the two mine counts:
+    zero makes them all safe, and a difference equal to their number makes
+    them all mines. This cracks patterns (1-2 edges, for example) that
+    single-number propagation cannot.
+
+    Constraints are compared as bitmasks, so each subset test is one AND;
+    sorting by popcount means only larger constraints are scanned as
+    supersets, halving the pairwise work.
+
+    Args:
+        constraints (list): (cells, mines) pairs as from _build_constraints.
+
+    Returns:
+        tuple: A (safe_bits, mine_bits) pair of bitboards of deduced cells.
+    """
+    masks = []
+    for cells, total in constraints:
+        mask = 0
+        for c in cells:
+            mask |= 1 << c
+        masks.append((mask, total))
+    masks.sort(key=lambda mc: mc[0].bit_count())
+    safe_bits = 0
+    mine_bits = 0
+    for a, (mask_a, total_a) in enumerate(masks):
+        for mask_b, total_b in masks[a + 1:]:
+            if mask_a & mask_b == mask_a and mask_a != mask_b:
+                diff = mask_b & ~mask_a
+                need = total_b - total_a
+                if need == 0:
+                    safe_bits |= diff  # The subset holds all the mines
+                elif need == diff.bit_count():
+                    mine_bits |= diff  # The difference is saturated with mines
+    return safe_bits, mine_bits
+
+def _frontier_components(constraints):
+    """
+    Split the frontier into independent components with union-find.
+
+    Cells that appear in a common constraint are joined; constraints in
+    different components share no cells, so each component can be
+    enumerated on its own instead of jointly.
+
+    Args:
+        constraints (list): (cells, mines) pairs as from _build_constraints.
+
+    Returns:
+        list: (cells, constraints) pairs per component, ordered by their
+            lowest cell index, with cells sorted.
+    """
+    parent = {}
+
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:  # Path compression
+            parent[x], x = root, parent[x]
+        return root
+
+    for con_cells, _ in constraints:
+        for c in con_cells:
+            parent.setdefault(c, c)
+        first = find(con_cells[0])
+        for c in con_cells[1:]:
+            parent[find(c)] = first
+    groups = {}
+    for con_cells, total in constraints:
+        groups.setdefault(find(con_cells[0]), []).append((con_cells, total))
+    components = []
+    for cons in groups.values():
+        cells = sorted({c for con_cells, _ in cons for c in con_cells})
+        components.append((cells, cons))
+    components.sort(key=lambda component: component[0][0])
+    return components
+
+def _component_key(cells, constraints):
+    """
+    Build a position-independent cache key for a frontier component.
+
+    Cells are relabeled by their rank within the component, so identical
+    local patterns (the classic 1-2-1 edge, for example) hash equally no
+    matter where on the board they occur.
+
+    Args:
+        cells (list[int]): The component's cells, sorted.
+        constraints (list): The component's (cells, mines) constraints.
+
+    Returns:
+        tuple: A hashable canonical form of the component.
+    """
+    rank = {cell: k for k, cell in enumerate(cells)}
+    return tuple(sorted(
+        (tuple(sorted(rank[c] for c in con_cells)), total)
+        for con_cells, total in constraints
+    ))
+
+# Components up to this size go through the bitmask enumerator; 2^12
+# assignments of cheap popcount checks beat backtracking bookkeeping
+_BITMASK_LIMIT = 12
+
+def _enumerate_bitmask(cells, constraints):
+    """
+    Count mine assignments of a small frontier component by bitmask sweep.
+
+    Each assignment of k cells is one integer; a constraint check is a
+    single AND plus popcount against the constraint's precomputed member
+    mask, so the whole 2^k sweep runs on int ops with no per-assignment
+    allocation.
+
+    Args:
+        cells (list[int]): The component's cell flat indices, sorted.
+        constraints (list): (cells, mines) pairs as from _build_constraints.
+
+    Returns:
+        tuple: (models, mine_models) as from _enumerate_frontier.
+    """
+    rank = {cell: k for k, cell in enumerate(cells)}
+    checks = []
+    for con_cells, total in constraints:
+        cmask = 0
+        for c in con_cells:
+            cmask |= 1 << rank[c]
+        checks.append((cmask, total))
+    n = len(cells)
+    models = 0
+    mine_models = [0] * n
+    for assignment in range(1 << n):
+        for cmask, total in checks:
+            if (assignment & cmask).bit_count() != total:
+                break
+        else:
+            models += 1
+            bits = assignment
+            while bits:
+                bit = bits & -bits
+                mine_models[bit.bit_length() - 1] += 1
+                bits ^= bit
+    return models, mine_models
+
+def _enumerate_frontier(cells, constraints):
+    """
+    Count the mine assignments of the frontier that satisfy all constraints.
+
+    Backtracks over the cells with forward checking (a constraint fails as
+    soon as its residual goes negative or exceeds its remaining unknowns)
+    and conflict-directed backjumping: when a subtree dead-ends for reasons
+    that do not involve the current cell, the sibling value is skipped.
+
+    Args:
+        cells (list[int]): Frontier cell flat indices, in assignment order.
+        constraints (list): (cells, mines) pairs as from _build_constraints.
+
+    Returns:
+        tuple: (models, mine_models) where models is the number of valid
+            assignments and mine_models[k] counts those with cells[k] a mine.
+    """
+    index_of = {cell: k for k, cell in enumerate(cells)}
+    var_cons = [[] for _ in cells]  # Constraint indices touching each variable
+    cons_vars = []  # Variable indices inside each constraint
+    residual = []  # Mines still to place in each constraint
+    remaining = []  # Unassigned variables left in each constraint
+    for j, (con_cells, total) in enumerate(constraints):
+        members = [index_of[c] for c in con_cells]
+        cons_vars.append(members)
+        residual.append(total)
+        remaining.append(len(members))
+        for k in members:
+            var_cons[k].append(j)
+    n = len(cells)
+    models = 0
+    mine_models = [0] * n
+    assignment = [0] * n
+
+    def solve(depth):
+        """Explore assignments from depth on; return None if any model was
+        found, otherwise the conflict set of variable depths responsible."""
+        nonlocal models
+        if depth == n:
+            models += 1
+            for k in range(n):
+                if assignment[k]:
+                    mine_models[k] += 1
+            return None
+        union_conflict = set()
+        found = False
+        for value in (0, 1):
+            assignment[depth] = value
+            for j in var_cons[depth]:
+                residual[j] -= value
+                remaining[j] -= 1
+            failed = -1
+            for j in var_cons[depth]:
+                if residual[j] < 0 or residual[j] > remaining[j]:
+                    failed = j
+                    break
+            if failed < 0:
+                conflict = solve(depth + 1)
+                if conflict is None:
+                    found = True
+                elif not found and depth not in conflict:
+                    # The dead end did not involve this cell, so the other
+                    # value fails identically: undo and backjump past it.
+                    for j in var_cons[depth]:
+                        residual[j] += value
+                        remaining[j] += 1
+                    return conflict
+                else:
+                    conflict.discard(depth)
+                    union_conflict |= conflict
+            else:
+                union_conflict |= {k for k in cons_vars[failed] if k < depth}
+            for j in var_cons[depth]:
+                residual[j] += value
+                remaining[j] += 1
+        return None if found else union_conflict
+
+    solve(0)
+    return models, mine_models
+
 class MinesweeperAI:
-    def __init__(self, game):
+    # Class-level cache of component enumeration results, keyed by
+    # _component_key, so repeated local patterns across moves and games
+    # become a dict lookup instead of a fresh enumeration
+    _pattern_cache = {}
+    _PATTERN_CACHE_LIMIT = 1 << 15
+
+    # Fixed attribute layout: drops the per-instance __dict__ and makes
+    # attribute reads a fixed-offset load, which matters a little when
+    # ai_demo_auto instantiates one AI per game in a benchmark loop
+    __slots__ = (
+        'game', 'verbose', 'moves', 'last_explanation', 'uncovered_bits',
+        'flag_bits', 'safe_bits', 'active_bits', 'full_mask', 'values',
+        'neighbors', 'safe_queue', 'safe_added_bits', '_probs_cache',
+    )
+
+    def __init__(self, game, verbose=False):
         """
         Initialize the Minesweeper AI with the game instance.
 
         Args:
             game (Minesweeper): The Minesweeper game instance.
+            verbose (bool): Build per-move explanations for display. Leave
+                off in benchmark loops to skip the formatting cost.
         """
         self.game = game
-        self.uncovered = set()  # Set to keep track of uncovered cells
-        self.flags = set()  # Set to keep track of flagged cells
+        self.verbose = verbose
+        self.moves = 0  # Number of moves made so far
+        self.last_explanation = None  # Only maintained when verbose
+        # Cell (r, c) maps to bit r*cols + c; a single Python int holds the whole board
+        self.uncovered_bits = 0  # Bitboard of uncovered cells
+        self.flag_bits = 0  # Bitboard of flagged cells
+        self.safe_bits = 0  # Bitboard of cells the last propagation proved safe
+        self.active_bits = 0  # Numbered cells that may still constrain neighbors
+        self.full_mask = (1 << (game.rows * game.cols)) - 1  # All cells set
+        # One contiguous byte per cell keeps neighbor reads in-cache
+        self.values = bytearray([UNKNOWN]) * (game.rows * game.cols)
+        # Share the board's cached adjacency table instead of building a
+        # second identical one; it is immutable and keyed per board size
+        self.neighbors = game._adj
+        self.safe_queue = collections.deque()  # Proven-safe cells waiting to be uncovered
+        self.safe_added_bits = 0  # Bitboard of cells ever pushed onto safe_queue
+        self._probs_cache = None  # Last probability map; dropped on any state change
 
     def uncover(self, row, col):
         """
@@ -17,11 +391,73 @@ class MinesweeperAI:
         Args:
             row (int): The row index of the cell to uncover.
             col (int): The column index of the cell to uncover.
+
+        Returns:
+            bool: False if a mine was uncovered (game over), True otherwise.
         """
-        if (row, col) in self.uncovered or (row, col) in self.flags:
-            return
-        self.uncovered.add((row, col))
-        # TODO: Implement logic to uncover the cell and update the grid state
+        game = self.game
+        idx = row * game.cols + col
+        bit = 1 << idx
+        if (self.uncovered_bits | self.flag_bits) & bit:
+            return True
+        if not game.uncover(row, col):
+            return False  # Hit a mine
+        self.uncovered_bits |= bit
+        self._probs_cache = None  # Board knowledge changed
+        value = game.board[idx]
+        self.values[idx] = value
+        game.player_board[idx] = value
+        game.uncovered_count += 1
+        if value == 0:
+            self._flood_zeros(idx)  # Reveal the whole zero region in one batch
+        else:
+            self.active_bits |= bit  # New numbered cell joins the frontier scan
+        return True
+
+    def _flood_zeros(self, start):
+        """
+        Reveal the connected zero region around a cell plus its number ring.
+
+        No cell adjacent to a zero can be a mine, so the whole region is
+        revealed in one BFS over precomputed neighbor indices instead of
+        one uncover call per cell.
+
+        Args:
+            start (int): Flat index of an uncovered zero-valued cell.
+        """
+        game = self.game
+        board = game.board
+        player_board = game.player_board
+        values = self.values
+        neighbors = self.neighbors
+        skip_bits = self.uncovered_bits | self.flag_bits
+        # Accumulate bitboards and the reveal count in locals; the instance
+        # attributes are written back once after the flood settles
+        uncovered_bits = self.uncovered_bits
+        active_bits = self.active_bits
+        uncovered = 0
+        # A contiguous int stack: no recursion depth to blow on big floods,
+        # and 4 bytes per pending cell instead of a list of Python ints
+        stack = array.array('i', [start])
+        push = stack.append
+        while stack:
+            for n in neighbors[stack.pop()]:
+                bit = 1 << n
+                if skip_bits & bit:
+                    continue
+                skip_bits |= bit
+                value = board[n]
+                values[n] = value
+                player_board[n] = value
+                uncovered += 1
+                uncovered_bits |= bit
+                if value == 0:
+                    push(n)  # Zeros keep the flood going
+                else:
+                    active_bits |= bit  # Number ring joins the frontier scan
+        self.uncovered_bits = uncovered_bits
+        self.active_bits = active_bits
+        game.uncovered_count += uncovered
 
     def flag(self, row, col):
         """
@@ -31,23 +467,88 @@ class MinesweeperAI:
             row (int): The row index of the cell to flag.
             col (int): The column index of the cell to flag.
         """
-        if (row, col) in self.uncovered:
+        bit = 1 << (row * self.game.cols + col)
+        if self.uncovered_bits & bit:
             return
-        self.flags.add((row, col))
-        # TODO: Implement logic to flag the cell
+        self.flag_bits |= bit
+        self._probs_cache = None  # Board knowledge changed
+        self.game.flag(row, col)
 
     def make_move(self):
         """
         Decide and make the next move based on the current state of the game.
+
+        Returns:
+            bool: False if the move uncovered a mine (game over), True otherwise.
         """
-        # Implement CSP and probability estimation logic to decide the next move
-        for row in range(self.game.rows):
-            for col in range(self.game.cols):
-                if self.is_safe_move(row, col):
-                    self.uncover(row, col)
-                    return
+        self.moves += 1
+        safe_bits, mine_bits, self.active_bits = _csp_propagate(
+            self.values, self.neighbors, self.flag_bits, self.active_bits)
+        self.safe_bits = safe_bits
+        self._commit_deductions(safe_bits, mine_bits)
+        move = self._pop_safe_move("constraint propagation")
+        if move is not None:
+            return move
+        # Single-number reasoning is exhausted; pairwise subset inference
+        # can still crack overlapping constraints before resorting to a guess
+        constraints = _build_constraints(
+            self.values, self.neighbors, self.flag_bits, self.active_bits)
+        sub_safe, sub_mine = _subset_inference(constraints)
+        self.safe_bits |= sub_safe
+        self._commit_deductions(sub_safe, sub_mine)
+        move = self._pop_safe_move("subset inference")
+        if move is not None:
+            return move
         # If no safe move is found, make a probabilistic move
-        self.probabilistic_move()
+        return self.probabilistic_move()
+
+    def _commit_deductions(self, safe_bits, mine_bits):
+        """
+        Flag newly deduced mines and queue newly deduced safe cells.
+
+        Args:
+            safe_bits (int): Bitboard of cells deduced safe.
+            mine_bits (int): Bitboard of cells deduced to be mines.
+        """
+        cols = self.game.cols
+        new_mines = mine_bits & ~self.flag_bits
+        while new_mines:
+            bit = new_mines & -new_mines  # Isolate the lowest set bit
+            self.flag(*divmod(bit.bit_length() - 1, cols))
+            new_mines ^= bit
+        # Queue newly proven safe cells; safe_added_bits keeps out duplicates
+        new_safe = safe_bits & ~self.safe_added_bits
+        while new_safe:
+            bit = new_safe & -new_safe
+            self.safe_queue.append(bit.bit_length() - 1)
+            new_safe ^= bit
+        self.safe_added_bits |= safe_bits
+
+    def _pop_safe_move(self, reason):
+        """
+        Uncover the next queued safe cell, if any.
+
+        Args:
+            reason (str): How the cell was proven safe, for explanations.
+
+        Returns:
+            bool: The uncover result, or None if the queue held no
+                still-covered cell.
+        """
+        cols = self.game.cols
+        # Bind to locals; the queue drain only reads state until it uncovers
+        safe_queue = self.safe_queue
+        uncovered_bits = self.uncovered_bits
+        while safe_queue:
+            idx = safe_queue.popleft()
+            if not uncovered_bits >> idx & 1:
+                row, col = divmod(idx, cols)
+                if self.verbose:
+                    self.last_explanation = (
+                        f"Uncovered ({row}, {col}): proven safe by {reason}."
+                    )
+                return self.uncover(row, col)
+        return None
 
     def is_safe_move(self, row, col):
         """
@@ -58,21 +559,154 @@ class MinesweeperAI:
             col (int): The column index of the cell to check.
 
         Returns:
-            bool: True if the move is safe, False otherwise.
+            bool: True if the last propagation proved the move safe, False otherwise.
+        """
+        return bool(self.safe_bits >> (row * self.game.cols + col) & 1)
+
+    def _frontier_probabilities(self):
+        """
+        Compute exact mine probabilities for the frontier cells.
+
+        Frontier cells (unknown cells touching a revealed number) get exact
+        probabilities by enumerating the satisfying mine assignments per
+        independent component.
+
+        Returns:
+            tuple: (probs, frontier_bits, expected_mines) — a dict of flat
+                index to probability, the frontier bitboard, and the
+                expected mine count over the frontier.
+        """
+        constraints = _build_constraints(
+            self.values, self.neighbors, self.flag_bits, self.active_bits)
+        probs = {}
+        frontier_bits = 0
+        expected_mines = 0.0
+        # Enumerate each independent frontier component on its own; a
+        # component's probabilities do not depend on the other components
+        for cells, component_cons in _frontier_components(constraints):
+            key = _component_key(cells, component_cons)
+            result = self._pattern_cache.get(key)
+            if result is None:
+                if len(cells) <= _BITMASK_LIMIT:
+                    result = _enumerate_bitmask(cells, component_cons)
+                else:
+                    result = _enumerate_frontier(cells, component_cons)
+                if len(self._pattern_cache) < self._PATTERN_CACHE_LIMIT:
+                    self._pattern_cache[key] = result
+            models, mine_models = result
+            if not models:
+                continue
+            for k, cell in enumerate(cells):
+                p = mine_models[k] / models
+                probs[cell] = p
+                frontier_bits |= 1 << cell
+                expected_mines += p
+        return probs, frontier_bits, expected_mines
+
+    def _off_frontier(self, frontier_bits, expected_mines):
+        """
+        Describe the cells away from the frontier and their shared density.
+
+        Args:
+            frontier_bits (int): Bitboard of frontier cells.
+            expected_mines (float): Expected mine count over the frontier.
+
+        Returns:
+            tuple: (off, density) — the off-frontier bitboard and the
+                per-cell probability from spreading the leftover mines.
+        """
+        off = self.full_mask & ~self.uncovered_bits & ~self.flag_bits & ~frontier_bits
+        if not off:
+            return 0, 0.0
+        mines_left = self.game.mines - self.flag_bits.bit_count() - expected_mines
+        return off, max(mines_left, 0.0) / off.bit_count()
+
+    def _mine_probabilities_flat(self):
+        """
+        Estimate the mine probability of every unknown, unflagged cell.
+
+        Frontier cells get exact probabilities; the cells away from the
+        frontier share the leftover mines evenly.
+
+        Returns:
+            dict: Mapping of flat cell index to estimated mine probability.
+        """
+        # Nothing changed since the last estimate, so it is still exact;
+        # back-to-back queries between moves become a single computation
+        if self._probs_cache is not None:
+            return self._probs_cache
+        probs, frontier_bits, expected_mines = self._frontier_probabilities()
+        off, density = self._off_frontier(frontier_bits, expected_mines)
+        while off:
+            bit = off & -off
+            probs[bit.bit_length() - 1] = density
+            off ^= bit
+        self._probs_cache = probs
+        return probs
+
+    def calculate_mine_probabilities(self):
+        """
+        Estimate the mine probability of every unknown, unflagged cell.
+
+        Returns:
+            dict: Mapping of (row, col) to estimated mine probability.
         """
-        # TODO: Implement logic to check if a move is safe based on current knowledge
-        return (row, col) not in self.uncovered and (row, col) not in self.flags
+        cols = self.game.cols
+        # Tuples are built only at this API boundary; the hot path stays flat
+        return {divmod(cell, cols): p for cell, p in self._mine_probabilities_flat().items()}
 
     def probabilistic_move(self):
         """
         Make a move based on probability estimation when no certain moves are available.
+
+        Returns:
+            bool: False if the move uncovered a mine (game over), True otherwise.
+        """
+        # Work from the frontier estimate plus a single representative
+        # off-frontier cell, instead of materializing a probability entry
+        # for every covered cell just to take the minimum
+        probs, frontier_bits, expected_mines = self._frontier_probabilities()
+        cell = prob = None
+        if probs:
+            # itemgetter runs in C; no lambda dispatch per comparison
+            cell, prob = min(probs.items(), key=operator.itemgetter(1))
+        off, density = self._off_frontier(frontier_bits, expected_mines)
+        if off and (prob is None or density < prob):
+            # All off-frontier cells tie, so the lowest one stands for them
+            cell = (off & -off).bit_length() - 1
+            prob = density
+        if cell is None:
+            return True  # Nothing left to uncover
+        row, col = divmod(cell, self.game.cols)
+        if self.verbose:
+            self.last_explanation = (
+                f"Uncovered ({row}, {col}): lowest estimated mine probability ({prob:.1%})."
+            )
+        return self.uncover(row, col)
+
+    def explain_last_move(self):
+        """
+        Describe the reasoning behind the most recent move.
+
+        Returns:
+            str: The explanation, or a placeholder when none is available.
+        """
+        if self.last_explanation is None:
+            return "No explanation available (no moves yet, or verbose is off)."
+        return self.last_explanation
+
+    def get_statistics(self):
+        """
+        Summarize the AI's progress in the current game.
+
+        Returns:
+            dict: Move, uncovered-cell and flag counts so far.
         """
-        # TODO: Implement logic to make a move based on probability estimation
-        for row in range(self.game.rows):
-            for col in range(self.game.cols):
-                if (row, col) not in self.uncovered and (row, col) not in self.flags:
-                    self.uncover(row, col)
-                    return
+        return {
+            'moves': self.moves,
+            'uncovered': self.uncovered_bits.bit_count(),
+            'flagged': self.flag_bits.bit_count(),
+        }
 
 # Example usage
 if __name__ == "__main__":
@@ -81,4 +715,4 @@ if __name__ == "__main__":
     game = Minesweeper(9, 9, 10)  # Create a 9x9 board with 10 mines
     ai = MinesweeperAI(game)
     ai.make_move()
-    game.print_board()
\ No newline at end of file
+    game.print_board()
